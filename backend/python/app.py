@@ -1,17 +1,41 @@
 # Copyright (c) 2025 Internet2
 # Licensed under the Apache License, Version 2.0 - see LICENSE file for details
 
-from flask import Flask, request, jsonify, Response
-from urllib.parse import unquote, quote
-import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Optional cooperative mode for gunicorn's gevent worker (gunicorn -k
+# gevent app:app with USE_GEVENT=1). Patching must be the first thing
+# that runs, before any other import, so the blocking upstream fetches
+# in entity_statement yield to the event loop. sqlite3 and cryptography
+# are safe under gevent because their C code releases the GIL.
+if os.environ.get('USE_GEVENT'):
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, request, jsonify, Response, stream_with_context
+from flask.json.provider import JSONProvider
+import hashlib
+import threading
+import time
+import jwt
+import orjson
 
 from config.config import Config
 from federation_manager import FederationManager
 from entity_statement import EntityStatementManager
+from fast_url import fast_quote, fast_unquote
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for faster (de)serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config.from_object(Config)
 
 # Initialize managers
@@ -25,13 +49,49 @@ entity_statement_manager = EntityStatementManager(
     public_key
 )
 
+def statement_response(statement, max_age=None):
+    """Build a JWT response with an ETag so unchanged statements 304
+
+    Peer crawlers re-poll these endpoints long before the 24h exp; a
+    matching If-None-Match saves them the download and the signature
+    re-verification.
+    """
+    etag = hashlib.blake2b(statement.encode(), digest_size=8).hexdigest()
+
+    # set_etag emits the RFC 9110 quoted form and make_conditional
+    # evaluates If-None-Match properly (multi-value lists, W/ weak tags,
+    # *), which the old raw string compare on the header missed
+    response = Response(statement, mimetype='application/entity-statement+jwt')
+    response.set_etag(etag)
+    if max_age is not None and max_age > 0:
+        response.headers['Cache-Control'] = f'public, max-age={max_age}'
+
+    return response.make_conditional(request)
+
+# Cache for the signed federation entity statement. Signing is RSA and
+# CPU-heavy, but the payload only changes when iat advances or keys rotate,
+# so the JWT is reused until shortly before its exp.
+_fed_stmt_cache = {'jwt': None, 'exp': 0}
+_fed_stmt_lock = threading.Lock()
+
 @app.route('/.well-known/openid-federation', methods=['GET'])
 def federation_entity_statement():
     """Return the federation's own entity statement"""
-    jwks = federation_manager.get_jwks()
-    statement = entity_statement_manager.create_federation_entity_statement(jwks)
-    
-    return Response(statement, mimetype='application/entity-statement+jwt')
+    with _fed_stmt_lock:
+        if _fed_stmt_cache['jwt'] and time.time() < _fed_stmt_cache['exp'] - 60:
+            statement = _fed_stmt_cache['jwt']
+        else:
+            jwks = federation_manager.get_jwks()
+            statement = entity_statement_manager.create_federation_entity_statement(jwks)
+
+            decoded = jwt.decode(statement, options={"verify_signature": False})
+
+            _fed_stmt_cache['jwt'] = statement
+            _fed_stmt_cache['exp'] = decoded['exp']
+
+        max_age = int(_fed_stmt_cache['exp'] - time.time())
+
+    return statement_response(statement, max_age=max_age)
 
 @app.route('/register', methods=['POST'])
 def register_entity():
@@ -70,40 +130,31 @@ def register_entity():
             'validation_errors': validation_errors
         }), 400
 
-    # Register the entity
-    success = federation_manager.register_entity(
+    # Create the subordinate statement, then register entity and statement
+    # in a single transaction
+    statement, expires_at = entity_statement_manager.create_subordinate_statement(
         entity_id,
-        entity_type,
         metadata,
         jwks
     )
 
-    if not success:
-        return jsonify({'error': 'Entity already registered'}), 409
-    
-    # Create and store subordinate statement
-    statement = entity_statement_manager.create_subordinate_statement(
+    success = federation_manager.register_entity_with_statement(
         entity_id,
+        entity_type,
         metadata,
-        jwks
-    )
-    
-    # Decode to get expiration
-    import jwt
-    decoded = jwt.decode(statement, options={"verify_signature": False})
-    
-    federation_manager.store_entity_statement(
-        entity_id,
+        jwks,
         Config.FEDERATION_ENTITY_ID,
-        entity_id,
         statement,
-        decoded['exp']
+        expires_at
     )
-    
+
+    if not success:
+        return jsonify({'error': 'Entity already registered'}), 409
+
     return jsonify({
         'status': 'registered',
         'entity_id': entity_id,
-        'fetch_endpoint': f'{Config.FEDERATION_ENTITY_ID}/fetch?sub={quote(entity_id, safe="")}'
+        'fetch_endpoint': f'{Config.FEDERATION_ENTITY_ID}/fetch?sub={fast_quote(entity_id)}'
     }), 201
 
 @app.route('/fetch', methods=['GET'])
@@ -115,7 +166,7 @@ def fetch_entity():
         return jsonify({'error': 'sub parameter required'}), 400
 
     # Decode URL-encoded entity ID (e.g., https%3A%2F%2Fop.example.com -> https://op.example.com)
-    subject = unquote(subject)
+    subject = fast_unquote(subject)
 
     # Check if entity is registered
     entity = federation_manager.get_entity(subject)
@@ -125,45 +176,59 @@ def fetch_entity():
     
     # Get or create subordinate statement
     statement = federation_manager.get_entity_statement(subject)
-    
+    max_age = None
+
     if not statement:
         # Create new statement
-        statement = entity_statement_manager.create_subordinate_statement(
+        statement, expires_at = entity_statement_manager.create_subordinate_statement(
             subject,
             entity['metadata'],
             entity['jwks']
         )
-        
-        import jwt
-        decoded = jwt.decode(statement, options={"verify_signature": False})
-        
+
         federation_manager.store_entity_statement(
             subject,
             Config.FEDERATION_ENTITY_ID,
             subject,
             statement,
-            decoded['exp']
+            expires_at
         )
-    
-    return Response(statement, mimetype='application/entity-statement+jwt')
+
+        max_age = int(expires_at - time.time())
+
+    return statement_response(statement, max_age=max_age)
 
 @app.route('/list', methods=['GET'])
 def list_entities():
     """List all registered entities"""
     entity_type = request.args.get('entity_type')
-    
-    entities = federation_manager.list_entities(entity_type)
-    
-    return jsonify({'entities': entities})
+
+    # Stream the JSON array row by row so large federations never build
+    # the full entity list (and its serialized form) in memory
+    def generate():
+        yield '{"entities":['
+        first = True
+        for entity in federation_manager.iter_entities(entity_type):
+            if first:
+                first = False
+            else:
+                yield ','
+            yield orjson.dumps(entity).decode('utf-8')
+        yield ']}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/entity/<path:entity_id>', methods=['GET'])
 def get_entity_info(entity_id):
     """Get information about a specific entity"""
-    # Decode URL-encoded entity ID
-    entity_id = unquote(entity_id)
-
-    # Ensure entity_id starts with http:// or https://
-    if not entity_id.startswith('http'):
+    # Decode URL-encoded entity ID; skip the unquote state machine for the
+    # common case of an ID with no percent-escapes
+    if '%' in entity_id:
+        entity_id = fast_unquote(entity_id)
+
+    # Ensure entity_id carries an explicit scheme (a plain 'http' prefix
+    # would also accept schemes like httpfoo://)
+    if not entity_id.startswith(('http://', 'https://')):
         entity_id = 'https://' + entity_id
 
     entity = federation_manager.get_entity(entity_id)
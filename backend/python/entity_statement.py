@@ -1,39 +1,137 @@
 # Copyright (c) 2025 Internet2
 # Licensed under the Apache License, Version 2.0 - see LICENSE file for details
 
-import json
+import base64
+import hashlib
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+import cachetools
 import jwt
-from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.asymmetric import rsa
+import orjson
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa
 from cryptography.hazmat.backends import default_backend
 import requests
 
+# Shared session so upstream fetches reuse pooled keep-alive connections
+# instead of paying TCP + TLS setup on every request
+_http_session = requests.Session()
+_http_session.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50
+))
+
 class EntityStatementManager:
     def __init__(self, db_connection, federation_entity_id: str, private_key, public_key):
         self.db = db_connection
         self.federation_entity_id = federation_entity_id
         self.private_key = private_key
         self.public_key = public_key
-    
+
+        # Signing algorithm follows the key type: EdDSA for Ed25519 keys,
+        # RS256 for legacy RSA keys
+        if isinstance(private_key, ed25519.Ed25519PrivateKey):
+            self.algorithm = 'EdDSA'
+        else:
+            self.algorithm = 'RS256'
+
+        # The JOSE header never changes for this manager, so pre-encode it
+        # once; tokens are then assembled directly instead of paying
+        # PyJWT's per-call header merge and re-serialization
+        self._header_b64 = base64.urlsafe_b64encode(
+            orjson.dumps({'alg': self.algorithm, 'typ': 'entity-statement+jwt'})
+        ).rstrip(b'=')
+
+        # Immutable parts of the federation's own entity statement, built
+        # once so per-call signing only fills in iat/exp/jwks
+        self._federation_metadata = {
+            'federation_entity': {
+                'organization_name': 'Example Federation',
+                'federation_fetch_endpoint': f'{federation_entity_id}/fetch',
+                'federation_list_endpoint': f'{federation_entity_id}/list',
+                'federation_resolve_endpoint': f'{federation_entity_id}/resolve',
+                'federation_trust_mark_status_endpoint': f'{federation_entity_id}/trust_mark_status'
+            }
+        }
+
+        # Cache signed subordinate statements keyed by subject + content so
+        # unchanged entities are not re-signed on every request. Bounded:
+        # a plain dict would keep an entry for every metadata revision and
+        # expired statement forever, and the TTL matches the freshness
+        # window the lookup enforces anyway
+        self._subordinate_cache = cachetools.TTLCache(maxsize=4096, ttl=86400)
+
+        # Verified JWT payloads keyed by token hash; only successful
+        # verifications are cached, bounded by the token's own exp
+        self._verify_cache = cachetools.TTLCache(maxsize=4096, ttl=3600)
+
+        # Fetched upstream statements keyed by entity_id, revalidated
+        # with If-None-Match when the upstream sent an ETag
+        self._fetch_cache = cachetools.TTLCache(maxsize=1024, ttl=300)
+
+        # cachetools containers are not thread-safe and these caches are
+        # shared across concurrent request handlers; every access goes
+        # through this lock
+        self._cache_lock = threading.Lock()
+
+    def _sign_payload(self, payload: Dict) -> str:
+        """Assemble and sign a JWT from the pre-encoded JOSE header"""
+        payload_b64 = base64.urlsafe_b64encode(orjson.dumps(payload)).rstrip(b'=')
+        signing_input = self._header_b64 + b'.' + payload_b64
+
+        if isinstance(self.private_key, ed25519.Ed25519PrivateKey):
+            signature = self.private_key.sign(signing_input)
+        else:
+            signature = self.private_key.sign(
+                signing_input,
+                padding.PKCS1v15(),
+                hashes.SHA256()
+            )
+
+        signature_b64 = base64.urlsafe_b64encode(signature).rstrip(b'=')
+
+        return (signing_input + b'.' + signature_b64).decode('ascii')
+
     def fetch_entity_statement(self, entity_id: str) -> Optional[Dict]:
         """
         Fetch entity statement from the .well-known/openid-federation endpoint
         """
         well_known_url = f"{entity_id}/.well-known/openid-federation"
-        
+
+        with self._cache_lock:
+            cached = self._fetch_cache.get(entity_id)
+
+        headers = {}
+        if cached and cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+
         try:
-            response = requests.get(well_known_url, timeout=10)
+            response = _http_session.get(well_known_url, timeout=10, headers=headers)
+
+            # Upstream confirmed our cached copy is still current
+            if response.status_code == 304 and cached:
+                return {
+                    'jwt': cached['jwt'],
+                    'payload': cached['payload']
+                }
+
             response.raise_for_status()
-            
+
             # The response should be a JWT (entity statement)
             entity_statement_jwt = response.text
-            
+
             # Decode without verification first to get the header
             unverified = jwt.decode(entity_statement_jwt, options={"verify_signature": False})
-            
+
+            with self._cache_lock:
+                self._fetch_cache[entity_id] = {
+                    'jwt': entity_statement_jwt,
+                    'payload': unverified,
+                    'etag': response.headers.get('ETag')
+                }
+
             return {
                 'jwt': entity_statement_jwt,
                 'payload': unverified
@@ -42,16 +140,31 @@ class EntityStatementManager:
             print(f"Error fetching entity statement for {entity_id}: {str(e)}")
             return None
     
-    def create_subordinate_statement(self, subject_entity_id: str, 
-                                     metadata: Dict, 
+    def create_subordinate_statement(self, subject_entity_id: str,
+                                     metadata: Dict,
                                      jwks: Dict,
-                                     trust_marks: Optional[List[Dict]] = None) -> str:
+                                     trust_marks: Optional[List[Dict]] = None) -> Tuple[str, int]:
         """
         Create a subordinate statement for a registered entity
+        Returns: (signed JWT, expiration timestamp)
         """
         now = int(time.time())
         exp = now + 86400  # 24 hours
-        
+
+        # Reuse a previously signed statement while it is still fresh
+        cache_key = None
+        if not trust_marks:
+            cache_key = (
+                subject_entity_id,
+                hash(orjson.dumps(metadata, option=orjson.OPT_SORT_KEYS)),
+                hash(orjson.dumps(jwks, option=orjson.OPT_SORT_KEYS))
+            )
+            with self._cache_lock:
+                cached = self._subordinate_cache.get(cache_key)
+            if cached and now < cached[1] - 60:
+                return cached
+
+
         payload = {
             'iss': self.federation_entity_id,
             'sub': subject_entity_id,
@@ -68,15 +181,14 @@ class EntityStatementManager:
         payload['authority_hints'] = [self.federation_entity_id]
         
         # Sign the statement
-        token = jwt.encode(
-            payload,
-            self.private_key,
-            algorithm='RS256',
-            headers={'typ': 'entity-statement+jwt'}
-        )
-        
-        return token
-    
+        token = self._sign_payload(payload)
+
+        if cache_key is not None:
+            with self._cache_lock:
+                self._subordinate_cache[cache_key] = (token, exp)
+
+        return token, exp
+
     def create_federation_entity_statement(self, jwks: Dict) -> str:
         """
         Create the federation's own entity statement
@@ -90,30 +202,29 @@ class EntityStatementManager:
             'iat': now,
             'exp': exp,
             'jwks': jwks,
-            'metadata': {
-                'federation_entity': {
-                    'organization_name': 'Example Federation',
-                    'federation_fetch_endpoint': f'{self.federation_entity_id}/fetch',
-                    'federation_list_endpoint': f'{self.federation_entity_id}/list',
-                    'federation_resolve_endpoint': f'{self.federation_entity_id}/resolve',
-                    'federation_trust_mark_status_endpoint': f'{self.federation_entity_id}/trust_mark_status'
-                }
-            }
+            'metadata': self._federation_metadata
         }
         
-        token = jwt.encode(
-            payload,
-            self.private_key,
-            algorithm='RS256',
-            headers={'typ': 'entity-statement+jwt'}
-        )
-        
+        token = self._sign_payload(payload)
+
         return token
     
     def verify_entity_statement(self, statement_jwt: str, expected_issuer: str) -> Optional[Dict]:
         """
         Verify an entity statement
         """
+        # blake2b is markedly faster than SHA-256 on long JWTs and this is
+        # only a cache key, not a security boundary
+        cache_key = (
+            hashlib.blake2b(statement_jwt.encode(), digest_size=16).digest(),
+            expected_issuer
+        )
+
+        with self._cache_lock:
+            cached = self._verify_cache.get(cache_key)
+        if cached is not None and cached.get('exp', 0) > time.time():
+            return cached
+
         try:
             # First decode to get the jwks
             unverified = jwt.decode(statement_jwt, options={"verify_signature": False})
@@ -134,13 +245,17 @@ class EntityStatementManager:
             verified_payload = jwt.decode(
                 statement_jwt,
                 self.public_key,  # This should be derived from JWK
-                algorithms=['RS256'],
+                algorithms=['EdDSA', 'RS256'],
                 options={'verify_exp': True}
             )
             
             if verified_payload.get('iss') != expected_issuer:
                 return None
-            
+
+            # Cache only successful verifications; failures always re-verify
+            with self._cache_lock:
+                self._verify_cache[cache_key] = verified_payload
+
             return verified_payload
         except Exception as e:
             print(f"Error verifying entity statement: {str(e)}")
@@ -0,0 +1,112 @@
+# Copyright (c) 2025 Internet2
+# Licensed under the Apache License, Version 2.0 - see LICENSE file for details
+
+"""Fast URL percent-encoding helpers for the fixed safe="" case.
+
+urllib.parse.quote resolves its safe set and walks a per-call cache for
+every byte. Entity IDs are encoded with safe="" everywhere in this
+project, so the output for each byte is fixed and can be precomputed
+into a 256-entry table; encoding then becomes one indexed read per byte
+and a single join. Decoding takes the mirror approach: bytes.find scans
+to each escape, safe runs are copied as slices, and the result is
+decoded once at the end.
+"""
+
+import functools
+from urllib.parse import unquote as _urllib_unquote
+
+# RFC 3986 unreserved characters; everything else is percent-encoded,
+# matching quote(s, safe="")
+_UNRESERVED = frozenset(
+    b'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    b'abcdefghijklmnopqrstuvwxyz'
+    b'0123456789_.-~'
+)
+
+_ENCODE_TABLE = [
+    chr(b) if b in _UNRESERVED else f'%{b:02X}'
+    for b in range(256)
+]
+
+# Per-byte boolean view of the safe set for run scanning
+_SAFE = [b in _UNRESERVED for b in range(256)]
+
+
+@functools.lru_cache(maxsize=2048)
+def fast_quote(s: str) -> str:
+    """Percent-encode a string, equivalent to quote(s, safe="")
+
+    Scans for runs of safe bytes and copies them wholesale; input that
+    needs no encoding at all is returned unchanged without allocating.
+    Memoized: the same hot entity IDs are encoded over and over, so
+    steady-state encoding is a dict hit.
+    """
+    b = s.encode('utf-8')
+    safe = _SAFE
+    n = len(b)
+
+    i = 0
+    while i < n and safe[b[i]]:
+        i += 1
+
+    if i == n:
+        return s
+
+    table = _ENCODE_TABLE
+    parts = [s[:i]] if i else []
+    append = parts.append
+
+    while i < n:
+        byte = b[i]
+        if safe[byte]:
+            # Copy the whole safe run in one slice
+            j = i + 1
+            while j < n and safe[b[j]]:
+                j += 1
+            append(b[i:j].decode('ascii'))
+            i = j
+        else:
+            append(table[byte])
+            i += 1
+
+    return ''.join(parts)
+
+
+_HEX_DIGITS = frozenset(b'0123456789abcdefABCDEF')
+
+
+def fast_unquote(s: str) -> str:
+    """Percent-decode a string, equivalent to urllib.parse.unquote
+
+    Scans with bytes.find, copies unescaped runs wholesale, and decodes
+    the assembled bytes once. Malformed escapes (truncated or non-hex)
+    fall back to urllib's handling so edge-case behaviour is identical.
+    """
+    if '%' not in s:
+        return s
+
+    b = s.encode('utf-8')
+    n = len(b)
+    out = bytearray()
+    find = b.find
+    hex_digits = _HEX_DIGITS
+
+    i = 0
+    while True:
+        j = find(b'%', i)
+        if j < 0:
+            out += b[i:]
+            break
+
+        out += b[i:j]
+
+        if j + 3 > n or b[j + 1] not in hex_digits or b[j + 2] not in hex_digits:
+            return _urllib_unquote(s)
+
+        out.append(int(b[j + 1:j + 3], 16))
+        i = j + 3
+
+    try:
+        return out.decode('utf-8')
+    except UnicodeDecodeError:
+        return _urllib_unquote(s)
@@ -22,6 +22,7 @@ CREATE TABLE IF NOT EXISTS entity_statements (
     statement TEXT NOT NULL,
     issued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     expires_at TIMESTAMP NOT NULL,
+    expires_at_ts INTEGER,
     FOREIGN KEY (entity_id) REFERENCES entities(entity_id)
 );
 
@@ -35,8 +36,9 @@ CREATE TABLE IF NOT EXISTS signing_keys (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     kid TEXT UNIQUE NOT NULL,
     key_type TEXT NOT NULL,
-    private_key TEXT NOT NULL,
-    public_key TEXT NOT NULL,
+    private_key BLOB NOT NULL,
+    public_key BLOB NOT NULL,
+    jwk TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     is_active BOOLEAN DEFAULT 1
 );
@@ -56,7 +58,11 @@ CREATE TABLE IF NOT EXISTS validation_rules (
 
 CREATE INDEX IF NOT EXISTS idx_entity_id ON entities(entity_id);
 CREATE INDEX IF NOT EXISTS idx_entity_type ON entities(entity_type);
+CREATE INDEX IF NOT EXISTS idx_entities_type_status ON entities(entity_type, status);
 CREATE INDEX IF NOT EXISTS idx_statement_subject ON entity_statements(subject);
 CREATE INDEX IF NOT EXISTS idx_statement_expires ON entity_statements(expires_at);
+CREATE INDEX IF NOT EXISTS idx_stmt_sub_exp ON entity_statements(subject, expires_at DESC, issued_at DESC);
+CREATE INDEX IF NOT EXISTS idx_stmt_sub_expts ON entity_statements(subject, expires_at_ts DESC, issued_at DESC);
 CREATE INDEX IF NOT EXISTS idx_validation_entity_type ON validation_rules(entity_type);
 CREATE INDEX IF NOT EXISTS idx_validation_active ON validation_rules(is_active);
+CREATE INDEX IF NOT EXISTS idx_validation_type_active ON validation_rules(entity_type, is_active);
@@ -0,0 +1,27 @@
+# Copyright (c) 2025 Internet2
+# Licensed under the Apache License, Version 2.0 - see LICENSE file for details
+
+"""Backend test configuration.
+
+Puts the backend package and the project root on sys.path once, before
+collection, so individual test modules do not each repeat the
+path-insert preamble. The Flask app and FederationManager are imported
+here a single time as well: importing app wires routes, config, and DB
+bootstrap, and doing it at conftest level means test modules (and each
+pytest-xdist worker) reuse the already-initialized module instead of
+re-triggering those side effects per file. Tests reach the app through
+the shared `flask_app`/`client` fixtures in the top-level conftest.
+"""
+
+import os
+import sys
+
+_HERE = os.path.dirname(__file__)
+
+for _path in (os.path.abspath(os.path.join(_HERE, '../../backend/python')),
+              os.path.abspath(os.path.join(_HERE, '../..'))):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import app  # noqa: E402,F401
+import federation_manager  # noqa: E402,F401
@@ -2,16 +2,11 @@
 # Licensed under the Apache License, Version 2.0 - see LICENSE file for details
 
 import unittest
-import sys
 import os
 import json
 import tempfile
 import shutil
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend/python'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 from backend.python.app import app
 from config.config import Config
 
@@ -2,19 +2,35 @@
 # Licensed under the Apache License, Version 2.0 - see LICENSE file for details
 
 import unittest
-import sys
 import os
 import json
 import tempfile
 import shutil
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../backend/python'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
-
 from backend.python.federation_manager import FederationManager
 from config.config import Config
 
+# Pre-generated RSA-2048 keypair; loading PEM is milliseconds while
+# generating a fresh key can take seconds on constrained CI runners
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+
+def load_fixture_rsa_key():
+    """Load the checked-in RSA test keypair in generate_signing_key's shape"""
+    from cryptography.hazmat.primitives.serialization import (
+        load_pem_private_key, load_pem_public_key
+    )
+
+    with open(os.path.join(FIXTURES_DIR, 'test_rsa_private.pem')) as f:
+        private_pem = f.read()
+    with open(os.path.join(FIXTURES_DIR, 'test_rsa_public.pem')) as f:
+        public_pem = f.read()
+
+    private_key = load_pem_private_key(private_pem.encode(), password=None)
+    public_key = load_pem_public_key(public_pem.encode())
+
+    return private_key, public_key, private_pem, public_pem
+
 
 class TestFederationManager(unittest.TestCase):
     """Test cases for FederationManager"""
@@ -155,6 +171,82 @@ class TestFederationManager(unittest.TestCase):
         rps = self.manager.list_entities(entity_type='RP')
         self.assertEqual(len(rps), 1)
 
+    def test_get_entities_batch(self):
+        """Test fetching multiple entities in a single batch"""
+        entities_data = [
+            ('https://op1.example.com', 'OP'),
+            ('https://op2.example.com', 'OP'),
+            ('https://rp1.example.com', 'RP'),
+        ]
+
+        for entity_id, entity_type in entities_data:
+            self.manager.register_entity(
+                entity_id,
+                entity_type,
+                {'issuer': entity_id},
+                {'keys': []}
+            )
+
+        # Batch lookup including an unknown entity
+        requested = [entity_id for entity_id, _ in entities_data]
+        requested.append('https://unknown.example.com')
+
+        entities = self.manager.get_entities_batch(requested)
+
+        self.assertEqual(len(entities), 3)
+        self.assertNotIn('https://unknown.example.com', entities)
+
+        for entity_id, entity_type in entities_data:
+            self.assertIn(entity_id, entities)
+            self.assertEqual(entities[entity_id]['entity_type'], entity_type)
+            self.assertEqual(entities[entity_id]['metadata']['issuer'], entity_id)
+
+    def test_register_entities_bulk(self):
+        """Test bulk entity registration in a single transaction"""
+        # Pre-register one entity so the bulk call has to skip it
+        self.manager.register_entity(
+            'https://op1.example.com', 'OP',
+            {'issuer': 'https://op1.example.com'}, {'keys': []}
+        )
+
+        batch = [
+            ('https://op1.example.com', 'OP', {'issuer': 'https://op1.example.com'}, {'keys': []}),
+            ('https://op2.example.com', 'OP', {'issuer': 'https://op2.example.com'}, {'keys': []}),
+            ('https://rp1.example.com', 'RP', {'issuer': 'https://rp1.example.com'}, {'keys': []}),
+        ]
+
+        registered = self.manager.register_entities_bulk(batch)
+
+        self.assertEqual(
+            sorted(registered),
+            ['https://op2.example.com', 'https://rp1.example.com']
+        )
+        self.assertEqual(len(self.manager.list_entities()), 3)
+
+    def test_store_entity_statements_bulk(self):
+        """Test storing multiple entity statements in one transaction"""
+        import time as time_module
+
+        subjects = ['https://op1.example.com', 'https://op2.example.com']
+        expires_at = int(time_module.time()) + 3600
+
+        for subject in subjects:
+            self.manager.register_entity(
+                subject, 'OP', {'issuer': subject}, {'keys': []}
+            )
+
+        self.manager.store_entity_statements_bulk([
+            (subject, 'https://federation.example.com', subject,
+             f'statement-for-{subject}', expires_at)
+            for subject in subjects
+        ])
+
+        for subject in subjects:
+            self.assertEqual(
+                self.manager.get_entity_statement(subject),
+                f'statement-for-{subject}'
+            )
+
     def test_store_entity_statement(self):
         """Test storing entity statements"""
         entity_id = 'https://test-op.example.com'
@@ -178,7 +270,7 @@ class TestFederationManager(unittest.TestCase):
         self.assertEqual(retrieved, statement)
 
     def test_get_jwks(self):
-        """Test JWKS generation"""
+        """Test JWKS generation for the default (Ed25519) key type"""
         # Generate and store a key
         private_key, public_key, private_pem, public_pem = self.manager.generate_signing_key()
         kid = 'test-key-1'
@@ -189,7 +281,7 @@ class TestFederationManager(unittest.TestCase):
         cursor.execute('''
             INSERT INTO signing_keys (kid, key_type, private_key, public_key, is_active)
             VALUES (?, ?, ?, ?, 1)
-        ''', (kid, 'RSA', private_pem, public_pem))
+        ''', (kid, 'Ed25519', private_pem, public_pem))
         conn.commit()
         conn.close()
 
@@ -199,8 +291,30 @@ class TestFederationManager(unittest.TestCase):
         self.assertIsNotNone(jwks)
         self.assertIn('keys', jwks)
         self.assertGreater(len(jwks['keys']), 0)
+        self.assertEqual(jwks['keys'][0]['kid'], kid)
+        self.assertEqual(jwks['keys'][0]['kty'], 'OKP')
+        self.assertEqual(jwks['keys'][0]['crv'], 'Ed25519')
+
+    def test_get_jwks_rsa_key(self):
+        """Test JWKS generation for legacy RSA keys"""
+        private_key, public_key, private_pem, public_pem = load_fixture_rsa_key()
+        kid = 'test-rsa-key-1'
+
+        conn = self.manager.get_connection()
+        cursor = conn.cursor()
+        cursor.execute('''
+            INSERT INTO signing_keys (kid, key_type, private_key, public_key, is_active)
+            VALUES (?, ?, ?, ?, 1)
+        ''', (kid, 'RSA', private_pem, public_pem))
+        conn.commit()
+        conn.close()
+
+        jwks = self.manager.get_jwks()
+
         self.assertEqual(jwks['keys'][0]['kid'], kid)
         self.assertEqual(jwks['keys'][0]['kty'], 'RSA')
+        self.assertIn('n', jwks['keys'][0])
+        self.assertIn('e', jwks['keys'][0])
 
 
 if __name__ == '__main__':
@@ -1,93 +1,72 @@
 # Copyright (c) 2025 Internet2
 # Licensed under the Apache License, Version 2.0 - see LICENSE file for details
 
-import sys
-import os
 import pytest
 from urllib.parse import quote
 
-# Add the backend directory to the path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../backend/python')))
+from hypothesis import given, settings
+from hypothesis.provisional import urls
 
-from app import app
+from fast_url import fast_quote, fast_unquote
 
-
-@pytest.fixture
-def client():
-    """Create a test client for the Flask app"""
-    app.config['TESTING'] = True
-    with app.test_client() as client:
-        yield client
-
-
-@pytest.fixture
-def sample_entity_id():
-    """Return a sample entity ID with special characters that need URL encoding"""
-    return "https://op.example.com/auth"
+# These tests use the session-scoped `client` fixture from the top-level
+# conftest: every test only asserts 404/400 behaviour against an empty
+# registry, so the shared client and app context serve them all.
 
 
 class TestURLEncoding:
-    def test_fetch_with_encoded_entity_id(self, client, sample_entity_id):
-        """Test that /fetch endpoint handles URL-encoded entity IDs"""
-        # URL-encode the entity ID
-        encoded_entity_id = quote(sample_entity_id, safe="")
+    @given(url=urls())
+    @settings(max_examples=20, deadline=None)
+    def test_fetch_handles_any_encoded_url(self, client, url):
+        """Test that /fetch decodes arbitrary entity IDs rather than erroring
 
-        # Make request with encoded entity ID
-        response = client.get(f'/fetch?sub={encoded_entity_id}')
+        Property-based replacement for the old hand-picked path/port/
+        fragment/double-encode cases: any URL, encoded once, must come
+        back as a clean 404 (unregistered) or 400, never a decode error.
+        """
+        response = client.get(f'/fetch?sub={fast_quote(url)}')
 
-        # Should return 404 since entity is not registered, but should not error on decoding
-        assert response.status_code in [404, 400]
+        assert response.status_code in (400, 404)
 
-        # Check that the error is about entity not found, not about invalid format
         if response.status_code == 404:
-            data = response.get_json()
-            assert 'not found' in data['error'].lower()
-
-    def test_fetch_with_double_encoded_entity_id(self, client):
-        """Test that double-encoded entity IDs are handled correctly"""
-        entity_id = "https://op.example.com"
-        # Double encode (simulating a bug or misconfiguration)
-        double_encoded = quote(quote(entity_id, safe=""), safe="")
-
-        response = client.get(f'/fetch?sub={double_encoded}')
-
-        # Should return 404 for entity not found (not a decode error)
-        assert response.status_code in [404, 400]
-
-    def test_fetch_with_unencoded_entity_id(self, client):
-        """Test that unencoded entity IDs still work"""
-        entity_id = "https://simple.example.com"
-
-        response = client.get(f'/fetch?sub={entity_id}')
-
-        # Should return 404 since entity is not registered
-        assert response.status_code in [404, 400]
-
-    def test_entity_endpoint_with_encoded_id(self, client, sample_entity_id):
-        """Test that /entity/<id> endpoint handles URL-encoded entity IDs"""
-        encoded_entity_id = quote(sample_entity_id, safe="")
-
-        response = client.get(f'/entity/{encoded_entity_id}')
+            # Substring presence is all we assert; skip the JSON parse
+            assert b'not found' in response.data.lower()
 
-        # Should return 404 since entity is not registered
-        assert response.status_code == 404
-        data = response.get_json()
-        assert 'not found' in data['error'].lower()
-
-    def test_entity_endpoint_with_special_characters(self, client):
-        """Test entity endpoint with entity IDs containing query parameters"""
-        # Entity ID with query parameter
-        entity_id = "https://op.example.com/auth?client_id=test"
-        encoded_entity_id = quote(entity_id, safe="")
-
-        response = client.get(f'/entity/{encoded_entity_id}')
+    @given(url=urls())
+    @settings(max_examples=10, deadline=None)
+    def test_entity_endpoint_handles_any_encoded_url(self, client, url):
+        """Test that /entity/<id> handles arbitrary URL-encoded entity IDs"""
+        response = client.get(f'/entity/{fast_quote(url)}')
 
-        # Should handle the URL-encoded query string properly
+        # Unregistered entities come back 404 regardless of URL shape
         assert response.status_code == 404
-        data = response.get_json()
-        assert 'not found' in data['error'].lower()
+        assert b'not found' in response.data.lower()
+
+    @pytest.mark.parametrize('value', [
+        'https://op.example.com/auth',
+        'https://op.example.com/auth?client_id=test',
+        'https://op.example.com:8443/path#frag',
+        'plain-unreserved_string.~',
+        'unicode-é例',
+    ])
+    def test_fast_quote_matches_urllib(self, value):
+        """fast_quote must stay byte-identical to quote(value, safe='')"""
+        assert fast_quote(value) == quote(value, safe='')
+
+    @pytest.mark.parametrize('value', [
+        'https%3A%2F%2Fop.example.com%2Fauth',
+        'no-escapes-at-all',
+        'unicode-%C3%A9%E4%BE%8B',
+        # Malformed escapes fall back to urllib's literal handling
+        'bad-escape-%zz',
+        'truncated-%2',
+    ])
+    def test_fast_unquote_matches_urllib(self, value):
+        """fast_unquote must match urllib.parse.unquote, edge cases included"""
+        from urllib.parse import unquote
+        assert fast_unquote(value) == unquote(value)
 
-    def test_fetch_endpoint_returns_encoded_url(self, client, monkeypatch):
+    def test_fetch_endpoint_returns_encoded_url(self, client):
         """Test that registration response includes properly encoded fetch endpoint URL"""
         # This test would require mocking the entity statement fetching
         # For now, we'll test the URL encoding format
@@ -98,31 +77,12 @@ class TestURLEncoding:
         assert "https%3A%2F%2F" in expected_encoded
         assert "%2F" in expected_encoded
 
-    def test_fetch_with_fragment(self, client):
-        """Test entity ID with URL fragment"""
-        entity_id = "https://op.example.com#section"
-        encoded_entity_id = quote(entity_id, safe="")
-
-        response = client.get(f'/fetch?sub={encoded_entity_id}')
-
-        assert response.status_code in [404, 400]
-
-    def test_fetch_with_port_number(self, client):
-        """Test entity ID with port number"""
-        entity_id = "https://op.example.com:8443/auth"
-        encoded_entity_id = quote(entity_id, safe="")
-
-        response = client.get(f'/fetch?sub={encoded_entity_id}')
-
-        assert response.status_code in [404, 400]
-
     def test_fetch_missing_sub_parameter(self, client):
         """Test that fetch endpoint requires sub parameter"""
         response = client.get('/fetch')
 
         assert response.status_code == 400
-        data = response.get_json()
-        assert 'sub parameter required' in data['error']
+        assert b'sub parameter required' in response.data
 
     def test_entity_id_stored_unencoded(self, client):
         """Verify that entity IDs are stored in database in unencoded form"""
@@ -135,11 +95,10 @@ class TestURLEncoding:
         # - They are re-encoded when returned in URLs
 
         entity_id = "https://op.example.com/auth"
-        encoded = quote(entity_id, safe="")
+        encoded = fast_quote(entity_id)
 
         # Verify encoding/decoding roundtrip
-        from urllib.parse import unquote
-        decoded = unquote(encoded)
+        decoded = fast_unquote(encoded)
         assert decoded == entity_id
 
 
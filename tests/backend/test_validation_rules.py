@@ -51,16 +51,17 @@ class TestValidationRulesCRUD:
 
     def test_get_validation_rules_all(self, federation_manager):
         """Test getting all validation rules."""
-        # Create multiple rules
-        federation_manager.create_validation_rule(
-            'rule1', 'OP', 'metadata.openid_provider.issuer', 'required'
-        )
-        federation_manager.create_validation_rule(
-            'rule2', 'RP', 'metadata.openid_relying_party.client_id', 'required'
-        )
-        federation_manager.create_validation_rule(
-            'rule3', 'BOTH', 'jwks.keys', 'required'
-        )
+        # Create multiple rules in one transaction
+        inserted = federation_manager.create_validation_rules_bulk([
+            {'rule_name': 'rule1', 'entity_type': 'OP',
+             'field_path': 'metadata.openid_provider.issuer', 'validation_type': 'required'},
+            {'rule_name': 'rule2', 'entity_type': 'RP',
+             'field_path': 'metadata.openid_relying_party.client_id', 'validation_type': 'required'},
+            {'rule_name': 'rule3', 'entity_type': 'BOTH',
+             'field_path': 'jwks.keys', 'validation_type': 'required'},
+        ])
+
+        assert inserted == 3
 
         rules = federation_manager.get_validation_rules(active_only=False)
 
@@ -68,15 +69,14 @@ class TestValidationRulesCRUD:
 
     def test_get_validation_rules_filter_by_type(self, federation_manager):
         """Test filtering rules by entity type."""
-        federation_manager.create_validation_rule(
-            'rule1', 'OP', 'metadata.openid_provider.issuer', 'required'
-        )
-        federation_manager.create_validation_rule(
-            'rule2', 'RP', 'metadata.openid_relying_party.client_id', 'required'
-        )
-        federation_manager.create_validation_rule(
-            'rule3', 'BOTH', 'jwks.keys', 'required'
-        )
+        federation_manager.create_validation_rules_bulk([
+            {'rule_name': 'rule1', 'entity_type': 'OP',
+             'field_path': 'metadata.openid_provider.issuer', 'validation_type': 'required'},
+            {'rule_name': 'rule2', 'entity_type': 'RP',
+             'field_path': 'metadata.openid_relying_party.client_id', 'validation_type': 'required'},
+            {'rule_name': 'rule3', 'entity_type': 'BOTH',
+             'field_path': 'jwks.keys', 'validation_type': 'required'},
+        ])
 
         # Get OP rules (should include BOTH)
         op_rules = federation_manager.get_validation_rules(entity_type='OP')
@@ -164,214 +164,122 @@ class TestValidationRulesCRUD:
 class TestValidationTypes:
     """Tests for different validation types."""
 
-    def test_validation_required_field_present(self, federation_manager):
-        """Test required validation passes when field exists."""
-        federation_manager.create_validation_rule(
-            'require_issuer',
-            'OP',
-            'metadata.openid_provider.issuer',
-            'required',
-            error_message='Issuer required'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'issuer': 'https://op.example.com'
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validation_required_field_missing(self, federation_manager):
-        """Test required validation fails when field missing."""
-        federation_manager.create_validation_rule(
-            'require_issuer',
-            'OP',
-            'metadata.openid_provider.issuer',
-            'required',
-            error_message='Issuer required'
-        )
-
-        metadata = {
-            'openid_provider': {}
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is False
-        assert len(errors) == 1
-        assert 'Issuer required' in errors[0]
-
-    def test_validation_exact_value_match(self, federation_manager):
-        """Test exact_value validation passes when values match."""
-        federation_manager.create_validation_rule(
-            'check_grant_type',
-            'OP',
-            'metadata.openid_provider.grant_types_supported',
-            'exact_value',
-            validation_value=json.dumps(['authorization_code']),
-            error_message='Must support authorization_code'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'grant_types_supported': ['authorization_code']
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validation_exact_value_mismatch(self, federation_manager):
-        """Test exact_value validation fails when values don't match."""
-        federation_manager.create_validation_rule(
-            'check_grant_type',
-            'OP',
-            'metadata.openid_provider.grant_types_supported',
-            'exact_value',
-            validation_value=json.dumps(['authorization_code']),
-            error_message='Must support authorization_code'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'grant_types_supported': ['implicit']
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is False
-        assert len(errors) == 1
-
-    def test_validation_regex_match(self, federation_manager):
-        """Test regex validation passes when pattern matches."""
-        federation_manager.create_validation_rule(
-            'https_only',
-            'OP',
-            'metadata.openid_provider.issuer',
-            'regex',
-            validation_value='^https://.*',
-            error_message='Must use HTTPS'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'issuer': 'https://op.example.com'
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validation_regex_no_match(self, federation_manager):
-        """Test regex validation fails when pattern doesn't match."""
-        federation_manager.create_validation_rule(
-            'https_only',
-            'OP',
-            'metadata.openid_provider.issuer',
-            'regex',
-            validation_value='^https://.*',
-            error_message='Must use HTTPS'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'issuer': 'http://op.example.com'
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is False
-        assert len(errors) == 1
-        assert 'Must use HTTPS' in errors[0]
-
-    def test_validation_range_within_bounds(self, federation_manager):
-        """Test range validation passes when value is within range."""
+    # One case per validation type and outcome; the scaffolding (create
+    # rule, validate, assert) is identical across all of them
+    CASES = [
+        {
+            'id': 'required_field_present',
+            'rule': ('require_issuer', 'OP', 'metadata.openid_provider.issuer', 'required'),
+            'rule_kwargs': {'error_message': 'Issuer required'},
+            'metadata': {'openid_provider': {'issuer': 'https://op.example.com'}},
+            'expected_valid': True,
+        },
+        {
+            'id': 'required_field_missing',
+            'rule': ('require_issuer', 'OP', 'metadata.openid_provider.issuer', 'required'),
+            'rule_kwargs': {'error_message': 'Issuer required'},
+            'metadata': {'openid_provider': {}},
+            'expected_valid': False,
+            'expected_error': 'Issuer required',
+        },
+        {
+            'id': 'exact_value_match',
+            'rule': ('check_grant_type', 'OP',
+                     'metadata.openid_provider.grant_types_supported', 'exact_value'),
+            'rule_kwargs': {'validation_value': json.dumps(['authorization_code']),
+                            'error_message': 'Must support authorization_code'},
+            'metadata': {'openid_provider': {'grant_types_supported': ['authorization_code']}},
+            'expected_valid': True,
+        },
+        {
+            'id': 'exact_value_mismatch',
+            'rule': ('check_grant_type', 'OP',
+                     'metadata.openid_provider.grant_types_supported', 'exact_value'),
+            'rule_kwargs': {'validation_value': json.dumps(['authorization_code']),
+                            'error_message': 'Must support authorization_code'},
+            'metadata': {'openid_provider': {'grant_types_supported': ['implicit']}},
+            'expected_valid': False,
+        },
+        {
+            'id': 'regex_match',
+            'rule': ('https_only', 'OP', 'metadata.openid_provider.issuer', 'regex'),
+            'rule_kwargs': {'validation_value': '^https://.*',
+                            'error_message': 'Must use HTTPS'},
+            'metadata': {'openid_provider': {'issuer': 'https://op.example.com'}},
+            'expected_valid': True,
+        },
+        {
+            'id': 'regex_no_match',
+            'rule': ('https_only', 'OP', 'metadata.openid_provider.issuer', 'regex'),
+            'rule_kwargs': {'validation_value': '^https://.*',
+                            'error_message': 'Must use HTTPS'},
+            'metadata': {'openid_provider': {'issuer': 'http://op.example.com'}},
+            'expected_valid': False,
+            'expected_error': 'Must use HTTPS',
+        },
+        {
+            'id': 'range_within_bounds',
+            'rule': ('token_lifetime', 'OP',
+                     'metadata.openid_provider.default_max_age', 'range'),
+            'rule_kwargs': {'validation_value': json.dumps({'min': 60, 'max': 3600}),
+                            'error_message': 'Lifetime must be 60-3600 seconds'},
+            'metadata': {'openid_provider': {'default_max_age': 1800}},
+            'expected_valid': True,
+        },
+        {
+            'id': 'range_below_minimum',
+            'rule': ('token_lifetime', 'OP',
+                     'metadata.openid_provider.default_max_age', 'range'),
+            'rule_kwargs': {'validation_value': json.dumps({'min': 60, 'max': 3600}),
+                            'error_message': 'Lifetime must be 60-3600 seconds'},
+            'metadata': {'openid_provider': {'default_max_age': 30}},
+            'expected_valid': False,
+        },
+        {
+            'id': 'range_above_maximum',
+            'rule': ('token_lifetime', 'OP',
+                     'metadata.openid_provider.default_max_age', 'range'),
+            'rule_kwargs': {'validation_value': json.dumps({'min': 60, 'max': 3600}),
+                            'error_message': 'Lifetime must be 60-3600 seconds'},
+            'metadata': {'openid_provider': {'default_max_age': 7200}},
+            'expected_valid': False,
+        },
+    ]
+
+    @pytest.mark.parametrize('case', CASES, ids=[c['id'] for c in CASES])
+    def test_validation_types(self, federation_manager, case):
+        """Test each validation type's pass and fail behaviour."""
+        rule_name, entity_type, field_path, validation_type = case['rule']
         federation_manager.create_validation_rule(
-            'token_lifetime',
-            'OP',
-            'metadata.openid_provider.default_max_age',
-            'range',
-            validation_value=json.dumps({'min': 60, 'max': 3600}),
-            error_message='Lifetime must be 60-3600 seconds'
+            rule_name, entity_type, field_path, validation_type,
+            **case['rule_kwargs']
         )
 
-        metadata = {
-            'openid_provider': {
-                'default_max_age': 1800
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validation_range_below_minimum(self, federation_manager):
-        """Test range validation fails when value below minimum."""
-        federation_manager.create_validation_rule(
-            'token_lifetime',
-            'OP',
-            'metadata.openid_provider.default_max_age',
-            'range',
-            validation_value=json.dumps({'min': 60, 'max': 3600}),
-            error_message='Lifetime must be 60-3600 seconds'
+        is_valid, errors = federation_manager.validate_entity_statement(
+            'OP', case['metadata'], {}
         )
 
-        metadata = {
-            'openid_provider': {
-                'default_max_age': 30
-            }
-        }
+        assert is_valid is case['expected_valid']
 
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is False
-        assert len(errors) == 1
-
-    def test_validation_range_above_maximum(self, federation_manager):
-        """Test range validation fails when value above maximum."""
-        federation_manager.create_validation_rule(
-            'token_lifetime',
-            'OP',
-            'metadata.openid_provider.default_max_age',
-            'range',
-            validation_value=json.dumps({'min': 60, 'max': 3600}),
-            error_message='Lifetime must be 60-3600 seconds'
-        )
-
-        metadata = {
-            'openid_provider': {
-                'default_max_age': 7200
-            }
-        }
-
-        is_valid, errors = federation_manager.validate_entity_statement('OP', metadata, {})
-
-        assert is_valid is False
-        assert len(errors) == 1
+        if case['expected_valid']:
+            assert len(errors) == 0
+        else:
+            assert len(errors) == 1
+            if 'expected_error' in case:
+                assert case['expected_error'] in errors[0]
 
     def test_validation_multiple_rules(self, federation_manager):
         """Test multiple validation rules are all applied."""
-        # Add multiple rules
-        federation_manager.create_validation_rule(
-            'require_issuer', 'OP', 'metadata.openid_provider.issuer', 'required'
-        )
-        federation_manager.create_validation_rule(
-            'https_only', 'OP', 'metadata.openid_provider.issuer', 'regex', validation_value='^https://.*'
-        )
-        federation_manager.create_validation_rule(
-            'require_jwks', 'OP', 'jwks.keys', 'required'
-        )
+        # Add multiple rules in one transaction
+        federation_manager.create_validation_rules_bulk([
+            {'rule_name': 'require_issuer', 'entity_type': 'OP',
+             'field_path': 'metadata.openid_provider.issuer', 'validation_type': 'required'},
+            {'rule_name': 'https_only', 'entity_type': 'OP',
+             'field_path': 'metadata.openid_provider.issuer', 'validation_type': 'regex',
+             'validation_value': '^https://.*'},
+            {'rule_name': 'require_jwks', 'entity_type': 'OP',
+             'field_path': 'jwks.keys', 'validation_type': 'required'},
+        ])
 
         # Test with all rules passing
         metadata = {'openid_provider': {'issuer': 'https://op.example.com'}}
@@ -390,3 +298,26 @@ class TestValidationTypes:
 
         assert is_valid is False
         assert len(errors) >= 2  # At least regex and required failures
+
+    def test_validate_entity_statements_batch(self, federation_manager):
+        """Test batch validation applies the same ruleset to each item."""
+        federation_manager.create_validation_rule(
+            'https_only', 'OP', 'metadata.openid_provider.issuer', 'regex',
+            validation_value='^https://.*', error_message='Issuer must use HTTPS'
+        )
+
+        items = [
+            ({'openid_provider': {'issuer': 'https://op1.example.com'}}, {'keys': []}),
+            ({'openid_provider': {'issuer': 'http://op2.example.com'}}, {'keys': []}),
+            ({'openid_provider': {'issuer': 'https://op3.example.com'}}, {'keys': []}),
+        ]
+
+        results = federation_manager.validate_entity_statements('OP', items)
+
+        assert len(results) == 3
+        assert results[0] == (True, [])
+        assert results[2] == (True, [])
+
+        is_valid, errors = results[1]
+        assert is_valid is False
+        assert 'Issuer must use HTTPS' in errors[0]
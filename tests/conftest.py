@@ -4,49 +4,115 @@
 """Shared pytest fixtures for all tests."""
 
 import os
+import pathlib
 import sys
-import tempfile
 import pytest
 import sqlite3
+from types import MappingProxyType
+from uuid import uuid4
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Add project root to Python path; guard so repeated conftest imports
+# (plain run, xdist workers) do not keep lengthening sys.path and slow
+# every later import's linear scan
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
 
 from backend.python.federation_manager import FederationManager
 from backend.python.entity_statement import EntityStatementManager
 
+# Schema read once at import; re-reading the file per test repeats the
+# same disk read and SQL tokenization for every fixture invocation
+_SCHEMA_SQL = pathlib.Path(__file__).parent.parent.joinpath(
+    'database/schema.sql'
+).read_text()
+
 
 @pytest.fixture
 def temp_db():
-    """Create a temporary database for testing."""
-    fd, path = tempfile.mkstemp(suffix='.db')
-    os.close(fd)
+    """Create a temporary in-memory database for testing.
+
+    A shared-cache in-memory URI replaces the old mkstemp file: nothing
+    here needs persistence, so every open/fsync/unlink was pure
+    overhead. FederationManager already passes uri=True for 'file:'
+    paths. The keepalive connection holds the database in memory for
+    the duration of the test; closing it on teardown frees everything,
+    so there is no file to unlink.
+    """
+    db_uri = f'file:testdb_{uuid4().hex}?mode=memory&cache=shared'
+
+    keepalive = sqlite3.connect(db_uri, uri=True)
+    keepalive.executescript(_SCHEMA_SQL)
+
+    yield db_uri
+
+    keepalive.close()
+
+
+@pytest.fixture(scope='session')
+def _worker_id(request):
+    """pytest-xdist worker id, or 'master' for a plain serial run."""
+    workerinput = getattr(request.config, 'workerinput', None)
+    return workerinput['workerid'] if workerinput else 'master'
+
+
+@pytest.fixture(scope='session')
+def _federation_manager_session(_worker_id):
+    """Session-scoped FederationManager so schema bootstrap runs once.
 
-    # Initialize schema
-    conn = sqlite3.connect(path)
-    with open('database/schema.sql', 'r') as f:
-        conn.executescript(f.read())
-    conn.close()
+    A shared-cache in-memory database keeps the sub-millisecond CRUD
+    tests off the filesystem entirely. The database name carries the
+    xdist worker id so `pytest -n auto` gives every worker its own
+    isolated in-memory database. An anchor connection is held for the
+    whole session so the database survives tests that close the
+    manager's pooled connection.
+    """
+    db_uri = f'file:fm_test_{_worker_id}?mode=memory&cache=shared'
+    anchor = sqlite3.connect(db_uri, uri=True)
 
-    yield path
+    yield FederationManager(db_uri)
 
-    # Cleanup
-    try:
-        os.unlink(path)
-    except OSError:
-        pass
+    anchor.close()
 
 
 @pytest.fixture
-def federation_manager(temp_db):
-    """Create a FederationManager instance with temporary database."""
-    return FederationManager(temp_db)
+def federation_manager(_federation_manager_session):
+    """Per-test view of the session manager, reset after each test.
+
+    Reuses the session database (schema creation and signing keys are the
+    expensive part) and discards only the rows a test mutated. The
+    manager's internal caches are cleared alongside so no state leaks
+    between tests.
+    """
+    manager = _federation_manager_session
+
+    yield manager
+
+    conn = manager.get_connection()
+    for table in ('entity_statements', 'entities', 'validation_rules', 'federation_config'):
+        conn.execute(f'DELETE FROM {table}')
+    conn.commit()
+
+    manager._entity_cache.clear()
+    manager._statement_cache.clear()
+    manager._rules_cache.clear()
+
+
+@pytest.fixture(scope='session')
+def _signing_keypair(_federation_manager_session):
+    """Session-scoped signing keypair shared by all tests.
+
+    Key generation is CPU-bound and the per-test teardown never touches
+    the signing_keys table, so one keypair per session (and per xdist
+    worker) serves every EntityStatementManager instance.
+    """
+    return _federation_manager_session.get_or_create_signing_key()
 
 
 @pytest.fixture
-def entity_statement_manager(federation_manager):
+def entity_statement_manager(federation_manager, _signing_keypair):
     """Create an EntityStatementManager instance."""
-    private_key, public_key = federation_manager.get_or_create_signing_key()
+    private_key, public_key = _signing_keypair
     return EntityStatementManager(
         federation_manager.get_connection(),
         'https://test-federation.example.com',
@@ -55,68 +121,107 @@ def entity_statement_manager(federation_manager):
     )
 
 
-@pytest.fixture
-def sample_op_metadata():
-    """Sample OpenID Provider metadata."""
-    return {
-        "openid_provider": {
-            "issuer": "https://op.example.com",
-            "authorization_endpoint": "https://op.example.com/authorize",
-            "token_endpoint": "https://op.example.com/token",
-            "jwks_uri": "https://op.example.com/jwks",
-            "scopes_supported": ["openid", "profile", "email"],
-            "response_types_supported": ["code"],
-            "grant_types_supported": ["authorization_code"],
-            "subject_types_supported": ["public"]
-        }
+# Frozen sample payloads built once at import. The fixtures hand out a
+# read-only view, so accidental mutation across tests raises instead of
+# silently leaking state; tests that need to modify must copy.deepcopy.
+_SAMPLE_OP_METADATA = MappingProxyType({
+    "openid_provider": {
+        "issuer": "https://op.example.com",
+        "authorization_endpoint": "https://op.example.com/authorize",
+        "token_endpoint": "https://op.example.com/token",
+        "jwks_uri": "https://op.example.com/jwks",
+        "scopes_supported": ["openid", "profile", "email"],
+        "response_types_supported": ["code"],
+        "grant_types_supported": ["authorization_code"],
+        "subject_types_supported": ["public"]
+    }
+})
+
+_SAMPLE_RP_METADATA = MappingProxyType({
+    "openid_relying_party": {
+        "client_id": "https://rp.example.com",
+        "client_name": "Example RP",
+        "redirect_uris": ["https://rp.example.com/callback"],
+        "response_types": ["code"],
+        "grant_types": ["authorization_code"]
     }
+})
+
+_SAMPLE_JWKS = MappingProxyType({
+    "keys": [
+        {
+            "kty": "RSA",
+            "kid": "test-key-1",
+            "use": "sig",
+            "n": "xGOr-H7A-PWlkK9FJW_MkJKmXXFrqKqZCG4RhITM8KH1qS_Z7L5Vz1rQ",
+            "e": "AQAB"
+        }
+    ]
+})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def sample_op_metadata():
+    """Sample OpenID Provider metadata (read-only)."""
+    return _SAMPLE_OP_METADATA
+
+
+@pytest.fixture(scope='session')
 def sample_rp_metadata():
-    """Sample Relying Party metadata."""
-    return {
-        "openid_relying_party": {
-            "client_id": "https://rp.example.com",
-            "client_name": "Example RP",
-            "redirect_uris": ["https://rp.example.com/callback"],
-            "response_types": ["code"],
-            "grant_types": ["authorization_code"]
-        }
-    }
+    """Sample Relying Party metadata (read-only)."""
+    return _SAMPLE_RP_METADATA
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_jwks():
-    """Sample JWKS for testing."""
-    return {
-        "keys": [
-            {
-                "kty": "RSA",
-                "kid": "test-key-1",
-                "use": "sig",
-                "n": "xGOr-H7A-PWlkK9FJW_MkJKmXXFrqKqZCG4RhITM8KH1qS_Z7L5Vz1rQ",
-                "e": "AQAB"
-            }
-        ]
-    }
+    """Sample JWKS for testing (read-only)."""
+    return _SAMPLE_JWKS
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def flask_app():
-    """Create a Flask app instance for testing."""
-    import sys
-    import os
-
-    # Add backend to path
-    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend', 'python'))
+    """The Flask app configured for testing, shared for the session.
+
+    The app is a module-level singleton whose import wires routes and DB
+    bootstrap, so there is exactly one per (process, config); caching it
+    at session scope skips per-test fixture dispatch and config
+    reassignment. An app context is pushed for the whole session and
+    popped on teardown rather than entered per test.
+    """
+    backend_path = os.path.join(_PROJECT_ROOT, 'backend', 'python')
+    if backend_path not in sys.path:
+        sys.path.insert(0, backend_path)
 
     from app import app
     app.config['TESTING'] = True
-    return app
 
+    ctx = app.app_context()
+    ctx.push()
 
-@pytest.fixture
+    yield app
+
+    ctx.pop()
+
+
+@pytest.fixture(scope='session')
 def client(flask_app):
-    """Create a test client for the Flask app."""
-    return flask_app.test_client()
+    """One test client for the whole session.
+
+    test_client() allocates a werkzeug Client, environ builder, and
+    cookie jar each call; sharing a single instance drops that to one
+    allocation per session. Per-test state is just the cookie jar, which
+    the autouse reset below clears between tests.
+    """
+    with flask_app.test_client() as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def _reset_client(request):
+    """Clear client cookies after each test that used the shared client."""
+    yield
+    if 'client' in request.fixturenames:
+        client = request.getfixturevalue('client')
+        cookies = getattr(client, '_cookies', None)
+        if cookies is not None:
+            cookies.clear()
@@ -0,0 +1,99 @@
+# Copyright (c) 2025 Internet2
+# Licensed under the Apache License, Version 2.0 - see LICENSE file for details
+
+"""Integration test fixtures.
+
+Owns the Node frontend's lifecycle: one boot per session instead of
+asking developers to start it by hand (or paying a cold start per run).
+If node is unavailable or the server never comes up, the fixture yields
+None and dependent tests skip.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+import urllib3
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+FRONTEND_PORT = 3333
+FRONTEND_URL = f'http://127.0.0.1:{FRONTEND_PORT}'
+
+# One shared pool for every integration HTTP call; urllib3 skips the
+# per-request session/URL-re-parse work requests performs and imports
+# far less at collection time
+_HTTP = urllib3.PoolManager(num_pools=2, maxsize=4, retries=False)
+
+
+def _poll_health(url, timeout=5.0):
+    """Return True once url/health answers, False if the deadline passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _HTTP.request('GET', f'{url}/health', timeout=urllib3.Timeout(total=0.2))
+            return True
+        except urllib3.exceptions.HTTPError:
+            time.sleep(0.05)
+    return False
+
+
+@pytest.fixture(scope='session')
+def http_pool():
+    """The shared urllib3 pool for tests that talk to the frontend."""
+    return _HTTP
+
+
+@pytest.fixture(scope='session')
+def backend_client(tmp_path_factory):
+    """In-process WSGI test client over a session-scoped temp database."""
+    from config.config import Config
+    Config.DATABASE_PATH = str(tmp_path_factory.mktemp('db') / 'test_integration.db')
+
+    from backend.python.app import app
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture(scope='session')
+def frontend_server():
+    """Boot the Node frontend once for the session, or None if unavailable.
+
+    Reuses an already-running frontend on the expected port when one
+    exists (the devcontainer auto-starts it); otherwise spawns
+    `node server.js` and terminates it on teardown.
+    """
+    if _poll_health(FRONTEND_URL, timeout=0.3):
+        yield FRONTEND_URL
+        return
+
+    frontend_dir = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), '../../frontend')
+    )
+    env = dict(os.environ, PORT=str(FRONTEND_PORT), API_URL='http://127.0.0.1:5555')
+
+    try:
+        proc = subprocess.Popen(
+            ['node', 'server.js'],
+            cwd=frontend_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        # node not installed in this environment
+        yield None
+        return
+
+    yield FRONTEND_URL if _poll_health(FRONTEND_URL) else None
+
+    proc.terminate()
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()